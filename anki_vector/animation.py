@@ -26,26 +26,61 @@ of play_animation, since individual animations can be deleted between Vector OS
 
 By default, when an SDK program starts, the SDK will request a list of known animation triggers and animations from the robot, which will be loaded
 and available from anim_list_triggers and anim_list, respectively, in the AnimationComponent.
+
+The lists are also saved to disk under ~/.anki_vector/anim_cache, so later connections to the same robot can use them
+straight away. They are reloaded from the robot in the background if its firmware has changed.
 """
 
 # __all__ should order by constants, event classes, other classes, functions.
 __all__ = ["AnimationComponent"]
 
-import concurrent
+import asyncio
+import json
+import logging
+import operator
+import os
+from pathlib import Path
+import sys
+import threading
 
 from google.protobuf import text_format
 
 from . import connection, exceptions, util
 from .messaging import protocol
 
+_get_name = operator.attrgetter("name")
+
+# Both list loaders save the cache, so writes are serialized to keep them from sharing the temporary file
+_cache_write_lock = threading.Lock()
+
 
 class AnimationComponent(util.Component):
     """Play animations on the robot"""
 
+    __slots__ = ('_anim_dict', '_anim_trigger_dict', '_anim_list_cache', '_anim_trigger_list_cache', '_cache_file', '_cache_os_version',
+                 '_warned_empty_anim', '_warned_empty_trigger', '_rpc_play_anim', '_rpc_play_trigger', '_rpc_list_anim', '_rpc_list_trigger')
+
     def __init__(self, robot):
         super().__init__(robot)
         self._anim_dict = {}
         self._anim_trigger_dict = {}
+        self._anim_list_cache = ()
+        self._anim_trigger_list_cache = ()
+        self._warned_empty_anim = False
+        self._warned_empty_trigger = False
+        # The lists are only saved to disk for robots created with cache_animation_lists
+        self._cache_file = None
+        if robot.cache_animation_lists:
+            self._cache_file = Path.home() / ".anki_vector" / "anim_cache" / f"{robot._serial}.json"  # pylint: disable=protected-access
+        # The firmware version the lists were loaded from, saved alongside them. None until the refresh of cached lists checks it.
+        self._cache_os_version = None
+
+        # Bind the animation rpcs once, since the connection's grpc interface does not change for the life of the component
+        grpc_interface = self.grpc_interface
+        self._rpc_play_anim = grpc_interface.PlayAnimation
+        self._rpc_play_trigger = grpc_interface.PlayAnimationTrigger
+        self._rpc_list_anim = grpc_interface.ListAnimations
+        self._rpc_list_trigger = grpc_interface.ListAnimationTriggers
 
     @property
     def anim_list(self):
@@ -70,11 +105,12 @@ class AnimationComponent(util.Component):
                     print(anim_name)
         """
         if not self._anim_dict:
-            self.logger.warning("Anim list was empty. Lazy-loading anim list now.")
-            result = self.load_animation_list()
-            if isinstance(result, concurrent.futures.Future):
-                result.result()
-        return list(self._anim_dict.keys())
+            if not self._warned_empty_anim:
+                self._warned_empty_anim = True
+                self.logger.warning("Anim list was empty. Lazy-loading anim list now.")
+            # Block until loaded regardless of robot type. On the connection thread this only schedules the request.
+            self.load_animation_list(_return_future=False)
+        return list(self._anim_list_cache)
 
     @property
     def anim_trigger_list(self):
@@ -106,42 +142,42 @@ class AnimationComponent(util.Component):
                     print(anim_trigger_name)
         """
         if not self._anim_trigger_dict:
-            self.logger.warning("Anim trigger list was empty. Lazy-loading anim trigger list now.")
-            result = self.load_animation_trigger_list()
-            if isinstance(result, concurrent.futures.Future):
-                result.result()
-        return list(self._anim_trigger_dict.keys())
-
-    async def _ensure_loaded(self):
+            if not self._warned_empty_trigger:
+                self._warned_empty_trigger = True
+                self.logger.warning("Anim trigger list was empty. Lazy-loading anim trigger list now.")
+            # Block until loaded regardless of robot type. On the connection thread this only schedules the request.
+            self.load_animation_trigger_list(_return_future=False)
+        return list(self._anim_trigger_list_cache)
+
+    async def _ensure_anims_loaded(self):
         """
         This is an optimization for the case where a user doesn't
-        need the animation_trigger_list or the animation_list. This way,
-        connections aren't delayed by the load_animation_triggers_list and
-        load_animation_list calls.
+        need the animation_list. This way, connections aren't delayed
+        by the load_animation_list call.
 
         If this is invoked inside another async function then we
         explicitly await the result.
         """
         if not self._anim_dict:
-            self.logger.warning("Anim list was empty. Lazy-loading anim list now.")
+            if not self._warned_empty_anim:
+                self._warned_empty_anim = True
+                self.logger.warning("Anim list was empty. Lazy-loading anim list now.")
             await self._load_animation_list()
-        if not self._anim_trigger_dict:
-            self.logger.warning("Anim trigger list was empty. Lazy-loading anim trigger list now.")
-            await self._load_animation_trigger_list()
 
-    async def _load_animation_list(self):
-        req = protocol.ListAnimationsRequest()
-        result = await self.grpc_interface.ListAnimations(req)
-        self.logger.debug(f"Animation List status={text_format.MessageToString(result.status, as_one_line=True)}, number of animations={len(result.animation_names)}")
-        self._anim_dict = {a.name: a for a in result.animation_names}
-        return result
+    async def _ensure_triggers_loaded(self):
+        """
+        This is an optimization for the case where a user doesn't
+        need the animation_trigger_list. This way, connections aren't
+        delayed by the load_animation_trigger_list call.
 
-    async def _load_animation_trigger_list(self):
-        req = protocol.ListAnimationTriggersRequest()
-        result = await self.grpc_interface.ListAnimationTriggers(req)
-        self.logger.debug(f"Animation Triggers List status={text_format.MessageToString(result.status, as_one_line=True)}, number of animation_triggers={len(result.animation_trigger_names)}")
-        self._anim_trigger_dict = {a.name: a for a in result.animation_trigger_names}
-        return result
+        If this is invoked inside another async function then we
+        explicitly await the result.
+        """
+        if not self._anim_trigger_dict:
+            if not self._warned_empty_trigger:
+                self._warned_empty_trigger = True
+                self.logger.warning("Anim trigger list was empty. Lazy-loading anim trigger list now.")
+            await self._load_animation_trigger_list()
 
     @connection.on_connection_thread(log_messaging=False, requires_control=False)
     async def load_animation_list(self):
@@ -165,7 +201,16 @@ class AnimationComponent(util.Component):
                 for anim_name in anim_names:
                     print(anim_name)
         """
-        return await self._load_animation_list()
+        req = protocol.ListAnimationsRequest()
+        result = await self._rpc_list_anim(req)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Animation List status=%s, number of animations=%d",
+                              text_format.MessageToString(result.status, as_one_line=True), len(result.animation_names))
+        self._anim_list_cache = tuple(map(sys.intern, map(_get_name, result.animation_names)))
+        self._anim_dict = dict(zip(self._anim_list_cache, result.animation_names))
+        if self._cache_file is not None:
+            await self.conn.loop.run_in_executor(None, self._write_cache)
+        return result
 
     @connection.on_connection_thread(log_messaging=False, requires_control=False)
     async def load_animation_trigger_list(self):
@@ -188,7 +233,82 @@ class AnimationComponent(util.Component):
                 for anim_trigger_name in anim_trigger_names:
                     print(anim_trigger_name)
         """
-        return await self._load_animation_trigger_list()
+        req = protocol.ListAnimationTriggersRequest()
+        result = await self._rpc_list_trigger(req)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Animation Triggers List status=%s, number of animation_triggers=%d",
+                              text_format.MessageToString(result.status, as_one_line=True), len(result.animation_trigger_names))
+        self._anim_trigger_list_cache = tuple(map(sys.intern, map(_get_name, result.animation_trigger_names)))
+        self._anim_trigger_dict = dict(zip(self._anim_trigger_list_cache, result.animation_trigger_names))
+        if self._cache_file is not None:
+            await self.conn.loop.run_in_executor(None, self._write_cache)
+        return result
+
+    # The undecorated loaders, awaited directly by code already running on the connection thread
+    _load_animation_list = load_animation_list.__wrapped__
+    _load_animation_trigger_list = load_animation_trigger_list.__wrapped__
+
+    def _write_cache(self):
+        """Save the animation and animation trigger names to disk for use by later connections.
+
+        This does blocking file i/o, so it is run in an executor rather than on the connection
+        thread. The file is written to a temporary path first and then moved into place, so a
+        concurrent reader never sees a partially written cache.
+        """
+        tmp_file = self._cache_file.with_suffix(".tmp")
+        with _cache_write_lock:
+            try:
+                self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump({"os_version": self._cache_os_version,
+                               "animations": self._anim_list_cache,
+                               "animation_triggers": self._anim_trigger_list_cache}, f)
+                os.replace(tmp_file, self._cache_file)
+            except OSError as e:
+                self.logger.debug(f"Unable to write animation cache {self._cache_file}: {e}")
+
+    async def _refresh_cached_animation_lists(self):
+        """Reload the cached lists from the robot if its firmware has changed since they were saved."""
+        version_state = await self.grpc_interface.VersionState(protocol.VersionStateRequest())
+        if version_state.os_version == self._cache_os_version:
+            return
+        await asyncio.gather(self._load_animation_list(), self._load_animation_trigger_list())
+        # Only record the new version once both lists have been reloaded for it
+        self._cache_os_version = version_state.os_version
+        await self.conn.loop.run_in_executor(None, self._write_cache)
+
+    def _load_cached_animation_lists(self) -> bool:
+        """Populate anim_list and anim_trigger_list from the on-disk cache.
+
+        The cache is written each time the lists are loaded from the robot. If it exists, the cached
+        lists are used immediately, and reloaded from the robot in the background if the robot's
+        firmware has changed since they were saved. The cached lists are kept if the refresh fails.
+
+        :returns: True if the lists were restored from the cache, False otherwise.
+        """
+        try:
+            with open(self._cache_file, encoding="utf-8") as f:
+                cache = json.load(f)
+            anim_names = cache["animations"]
+            anim_trigger_names = cache["animation_triggers"]
+            os_version = cache.get("os_version")
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return False
+        if not anim_names or not anim_trigger_names:
+            return False
+        self._anim_dict = {sys.intern(name): protocol.Animation(name=name) for name in anim_names}
+        self._anim_trigger_dict = {sys.intern(name): protocol.AnimationTrigger(name=name) for name in anim_trigger_names}
+        self._anim_list_cache = tuple(self._anim_dict)
+        self._anim_trigger_list_cache = tuple(self._anim_trigger_dict)
+        self._cache_os_version = os_version
+
+        def log_failure(fut):
+            if not fut.cancelled() and fut.exception() is not None:
+                self.logger.warning(f"Failed to refresh the cached animation lists, using stale lists: {fut.exception()}")
+
+        request = self.conn.run_coroutine(self._refresh_cached_animation_lists())
+        request.add_done_callback(log_failure)
+        return True
 
     @connection.on_connection_thread()
     async def play_animation_trigger(self, anim_trigger: str, loop_count: int = 1, use_lift_safe: bool = False, ignore_body_track: bool = False, ignore_head_track: bool = False, ignore_lift_track: bool = False):  # START
@@ -215,17 +335,18 @@ class AnimationComponent(util.Component):
         """
         animation_trigger = anim_trigger
         if not isinstance(anim_trigger, protocol.AnimationTrigger):
-            await self._ensure_loaded()
-            if anim_trigger not in self.anim_trigger_list:
+            await self._ensure_triggers_loaded()
+            if anim_trigger not in self._anim_trigger_dict:
                 raise exceptions.VectorException(f"Unknown animation trigger: {anim_trigger}")
             animation_trigger = self._anim_trigger_dict[anim_trigger]
-        req = protocol.PlayAnimationTriggerRequest(animation_trigger=animation_trigger,
-                                                   loops=loop_count,
-                                                   use_lift_safe=use_lift_safe,
-                                                   ignore_body_track=ignore_body_track,
-                                                   ignore_head_track=ignore_head_track,
-                                                   ignore_lift_track=ignore_lift_track)
-        return await self.grpc_interface.PlayAnimationTrigger(req)
+        req = self._scratch_request(protocol.PlayAnimationTriggerRequest)
+        req.animation_trigger.CopyFrom(animation_trigger)  # pylint: disable=no-member
+        req.loops = loop_count
+        req.use_lift_safe = use_lift_safe
+        req.ignore_body_track = ignore_body_track
+        req.ignore_head_track = ignore_head_track
+        req.ignore_lift_track = ignore_lift_track
+        return await self._rpc_play_trigger(req)
 
     @connection.on_connection_thread()
     async def play_animation(self, anim: str, loop_count: int = 1, ignore_body_track: bool = False, ignore_head_track: bool = False, ignore_lift_track: bool = False):
@@ -252,13 +373,14 @@ class AnimationComponent(util.Component):
         """
         animation = anim
         if not isinstance(anim, protocol.Animation):
-            await self._ensure_loaded()
-            if anim not in self.anim_list:
+            await self._ensure_anims_loaded()
+            if anim not in self._anim_dict:
                 raise exceptions.VectorException(f"Unknown animation: {anim}")
             animation = self._anim_dict[anim]
-        req = protocol.PlayAnimationRequest(animation=animation,
-                                            loops=loop_count,
-                                            ignore_body_track=ignore_body_track,
-                                            ignore_head_track=ignore_head_track,
-                                            ignore_lift_track=ignore_lift_track)
-        return await self.grpc_interface.PlayAnimation(req)
+        req = self._scratch_request(protocol.PlayAnimationRequest)
+        req.animation.CopyFrom(animation)  # pylint: disable=no-member
+        req.loops = loop_count
+        req.ignore_body_track = ignore_body_track
+        req.ignore_head_track = ignore_head_track
+        req.ignore_lift_track = ignore_lift_track
+        return await self._rpc_play_anim(req)
@@ -37,13 +37,13 @@ __all__ = ['DEFAULT_OBJECT_COLORS',
 
 
 from enum import Enum
-import collections
 import functools
+import inspect
 import sys
 from typing import Callable, Iterable, Tuple, Union
 
 try:
-    from PIL import Image, ImageDraw, ImageFont
+    from PIL import Image, ImageChops, ImageDraw, ImageFont
 except ImportError:
     sys.exit("Cannot import from PIL: Do `pip3 install --user Pillow` to install")
 except SyntaxError:
@@ -139,6 +139,9 @@ class ImageText:  # pylint: disable=too-few-public-methods
     def __init__(self, text: str, position: int = AnnotationPosition.BOTTOM_RIGHT, align: str = "left", color: str = "white",
                  font = None, line_spacing: int = 3, outline_color: str = None, full_outline: bool = True):
         self.text = text
+        self._position = None
+        self._is_top = False
+        self._is_left = False
         self.position = position
         self.align = align
         self.color = color
@@ -147,47 +150,108 @@ class ImageText:  # pylint: disable=too-few-public-methods
         self.outline_color = outline_color
         self.full_outline = full_outline
 
+    @property
+    def position(self) -> AnnotationPosition:
+        """Where on the screen to render the text."""
+        return self._position
+
+    @position.setter
+    def position(self, position: AnnotationPosition) -> None:
+        value = position.value if isinstance(position, AnnotationPosition) else int(position)
+        self._position = position
+        self._is_top = bool(value & AnnotationPosition.TOP.value)
+        self._is_left = bool(value & AnnotationPosition.LEFT.value)
+
     def render(self, draw: ImageDraw.ImageDraw, bounds: tuple) -> ImageDraw.ImageDraw:
         """Renders the text onto an image within the specified bounding box.
 
         :param draw: The drawable surface to write on
         :param bounds(top_left_x, top_left_y, bottom_right_x, bottom_right_y): bounding box
         """
+        return self._render_tile(draw, bounds, _render_text_tile(*self._tile_key()))
+
+    def _tile_key(self) -> tuple:
+        """The arguments to :func:`_render_text_tile` for this text."""
+        return (self.text, self.font, self.align, self.line_spacing,
+                self.outline_color is not None, self.full_outline)
+
+    def _render_tile(self, draw: ImageDraw.ImageDraw, bounds: tuple, tile: tuple) -> ImageDraw.ImageDraw:
+        """Draws a tile returned by :func:`_render_text_tile` within the specified bounding box."""
+        return self._draw_tile(draw, self._tile_position(bounds, tile), tile)
+
+    def _tile_position(self, bounds: tuple, tile: tuple) -> tuple:
+        """The position to draw a tile returned by :func:`_render_text_tile` within the specified bounding box."""
         (bx1, by1, bx2, by2) = bounds
-        text_width, text_height = draw.textsize(self.text, font=self.font)
+        _, _, (offset_x, offset_y), (text_width, text_height) = tile
 
-        if self.position.value & AnnotationPosition.TOP.value:
+        if self._is_top:
             y = by1
         else:
             y = by2 - text_height
 
-        if self.position.value & AnnotationPosition.LEFT.value:
+        if self._is_left:
             x = bx1
         else:
             x = bx2 - text_width
 
-        # helper method for each draw call below
-        def _draw_text(pos, color):
-            draw.text(pos, self.text, font=self.font, fill=color,
-                      align=self.align, spacing=self.line_spacing)
-
-        if self.outline_color is not None:
-            # Pillow doesn't support outlined or shadowed text directly.
-            # We manually draw the text multiple times to achieve the effect.
-            if self.full_outline:
-                _draw_text((x - 1, y), self.outline_color)
-                _draw_text((x + 1, y), self.outline_color)
-                _draw_text((x, y - 1), self.outline_color)
-                _draw_text((x, y + 1), self.outline_color)
-            else:
-                # just draw a drop shadow (cheaper)
-                _draw_text((x + 1, y + 1), self.outline_color)
+        return x + offset_x, y + offset_y
+
+    def _draw_tile(self, draw: ImageDraw.ImageDraw, position: tuple, tile: tuple) -> ImageDraw.ImageDraw:
+        """Draws a tile returned by :func:`_render_text_tile` at a position from :meth:`_tile_position`."""
+        outline_mask, text_mask, _, _ = tile
 
-        _draw_text((x, y), self.color)
+        if text_mask is None:
+            # Nothing visible to draw
+            return draw
+
+        if outline_mask is not None:
+            draw.bitmap(position, outline_mask, fill=self.outline_color)
+        draw.bitmap(position, text_mask, fill=self.color)
 
         return draw
 
 
+@functools.lru_cache(maxsize=256)
+def _render_text_tile(text: str, font, align: str, line_spacing: int, outline: bool, full_outline: bool) -> tuple:
+    """Rasterize text into cached masks so repeated renders only need to blit them.
+
+    :returns: A tuple of (outline_mask, text_mask, (offset_x, offset_y), (text_width, text_height)).
+        The masks are "L" mode images cropped to the drawn pixels, to be drawn at the offset from
+        the text position. outline_mask is None if no outline was requested, and both masks are
+        None if nothing would be drawn.
+    """
+    text_width, text_height = ImageDraw.Draw(Image.new("L", (1, 1))).textsize(text, font=font)
+    # Leave room for the outline and for glyphs which extend past the reported text size
+    margin = 2 + text_height // 2
+    tile_size = (text_width + 2 * margin, text_height + 2 * margin)
+
+    # The text is only rasterized once, any outline is built from shifted copies of it.
+    # The margin keeps the text clear of the tile edges, so shifting by a pixel never wraps any of it around.
+    text_mask = Image.new("L", tile_size)
+    ImageDraw.Draw(text_mask).text((margin, margin), text, font=font, fill=255, align=align, spacing=line_spacing)
+
+    text_bbox = text_mask.getbbox()
+    if text_bbox is None:
+        return None, None, (0, 0), (text_width, text_height)
+
+    outline_mask = None
+    if outline:
+        # Pillow doesn't support outlined or shadowed text directly.
+        # Screen blending the shifted copies matches drawing the text once per offset.
+        if full_outline:
+            outline_mask = ImageChops.screen(ImageChops.offset(text_mask, -1, 0), ImageChops.offset(text_mask, 1, 0))
+            outline_mask = ImageChops.screen(outline_mask, ImageChops.offset(text_mask, 0, -1))
+            outline_mask = ImageChops.screen(outline_mask, ImageChops.offset(text_mask, 0, 1))
+        else:
+            # just draw a drop shadow (cheaper)
+            outline_mask = ImageChops.offset(text_mask, 1, 1)
+        # The outline extends one pixel beyond the text on each side
+        text_bbox = (text_bbox[0] - 1, text_bbox[1] - 1, text_bbox[2] + 1, text_bbox[3] + 1)
+        outline_mask = outline_mask.crop(text_bbox)
+    text_mask = text_mask.crop(text_bbox)
+    return outline_mask, text_mask, (text_bbox[0] - margin, text_bbox[1] - margin), (text_width, text_height)
+
+
 def add_img_box_to_image(draw: ImageDraw.ImageDraw, box: util.ImageRect, color: str, text: Union[ImageText, Iterable[ImageText]] = None) -> None:
     """Draw a box on an image and optionally add text.
 
@@ -201,15 +265,16 @@ def add_img_box_to_image(draw: ImageDraw.ImageDraw, box: util.ImageRect, color:
     :param text: The text to display - may be a single ImageText instance,
         or any iterable (eg a list of ImageText instances) to display multiple pieces of text.
     """
-    x1, y1 = box.x_top_left, box.y_top_left
-    x2, y2 = (box.x_top_left + box.width), (box.y_top_left + box.height)
-    draw.rectangle([x1, y1, x2, y2], outline=color)
+    # Pillow truncates the coordinates anyway, passing ints avoids converting them on every call
+    x1, y1 = int(box.x_top_left), int(box.y_top_left)
+    x2, y2 = int(box.x_top_left + box.width), int(box.y_top_left + box.height)
+    draw.rectangle((x1, y1, x2, y2), outline=color)
     if text is not None:
-        if isinstance(text, collections.Iterable):
+        if isinstance(text, ImageText):
+            text.render(draw, (x1, y1, x2, y2))
+        else:
             for t in text:
                 t.render(draw, (x1, y1, x2, y2))
-        else:
-            text.render(draw, (x1, y1, x2, y2))
 
 
 def add_polygon_to_image(draw: ImageDraw.ImageDraw, poly_points: list, scale: float, line_color: str, fill_color: str = None) -> None:
@@ -232,13 +297,26 @@ def add_polygon_to_image(draw: ImageDraw.ImageDraw, poly_points: list, scale: fl
         return
 
     # Convert poly_points to the PIL format and scale them to the image
-    pil_poly_points = []
-    for pt in poly_points:
-        pil_poly_points.append((pt.x * scale, pt.y * scale))
+    if scale == 1:
+        pil_poly_points = [(pt.x, pt.y) for pt in poly_points]
+    else:
+        pil_poly_points = [(pt.x * scale, pt.y * scale) for pt in poly_points]
 
     draw.polygon(pil_poly_points, fill=fill_color, outline=line_color)
 
 
+@functools.lru_cache(maxsize=None)
+def _apply_accepts_draw(cls) -> bool:
+    """Whether an Annotator class's apply method takes the shared draw argument.
+
+    User annotators written before the argument was added only accept (image, scale).
+    """
+    try:
+        return 'draw' in inspect.signature(cls.apply).parameters
+    except (TypeError, ValueError):
+        return False
+
+
 def _find_key_for_cls(d, cls):
     for c in cls.__mro__:
         result = d.get(c, None)
@@ -263,14 +341,30 @@ class Annotator:
         #: :class:`~anki_vector.world.World`: The world object for the robot who owns the camera
         self.world = img_annotator.world
 
-        #: bool: Set enabled to false to prevent the annotator being called
-        self.enabled = True
+        self._enabled = True
 
         if priority is not None:
             self.priority = priority
 
-    def apply(self, image: Image.Image, scale: float):
-        """Applies the annotation to the image."""
+    @property
+    def enabled(self) -> bool:
+        """bool: Set enabled to false to prevent the annotator being called"""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool) -> None:
+        self._enabled = enabled
+        self.img_annotator._update_active_annotators()  # pylint: disable=protected-access
+
+    def apply(self, image: Image.Image, scale: float, draw: ImageDraw.ImageDraw = None):
+        """Applies the annotation to the image.
+
+        :param image: The image to annotate
+        :param scale: The scale the image has been resized by
+        :param draw: A drawing context for the image, shared by all annotators
+            applied to it. Subclasses may leave this parameter out, in which case
+            it is not passed.
+        """
         # should be overriden by a subclass
         raise NotImplementedError()
 
@@ -293,8 +387,9 @@ class ObjectAnnotator(Annotator):  # pylint: disable=too-few-public-methods
         if object_colors is not None:
             self.object_colors = object_colors
 
-    def apply(self, image: Image.Image, scale: float) -> None:
-        draw = ImageDraw.Draw(image)
+    def apply(self, image: Image.Image, scale: float, draw: ImageDraw.ImageDraw = None) -> None:
+        if draw is None:
+            draw = ImageDraw.Draw(image)
         for obj in self.world.visible_objects:
             color = _find_key_for_cls(self.object_colors, obj.__class__)
             text = self._label_for_obj(obj)
@@ -324,8 +419,9 @@ class FaceAnnotator(Annotator):  # pylint: disable=too-few-public-methods
         if box_color is not None:
             self.box_color = box_color
 
-    def apply(self, image: Image.Image, scale: float) -> None:
-        draw = ImageDraw.Draw(image)
+    def apply(self, image: Image.Image, scale: float, draw: ImageDraw.ImageDraw = None) -> None:
+        if draw is None:
+            draw = ImageDraw.Draw(image)
         for obj in self.world.visible_faces:
             text = self._label_for_face(obj)
             box = obj.last_observed_image_rect
@@ -365,10 +461,28 @@ class TextAnnotator(Annotator):  # pylint: disable=too-few-public-methods
     def __init__(self, img_annotator, text):
         super().__init__(img_annotator)
         self.text = text
-
-    def apply(self, image: Image.Image, scale: int) -> None:
-        d = ImageDraw.Draw(image)
-        self.text.render(d, (0, 0, image.width, image.height))
+        # The rendered text is kept here as well as in the shared text cache, so that
+        # frequently changing text elsewhere can't evict it.
+        self._tile_key = None
+        self._tile = None
+        # The position only changes with the tile, the image size or the text position
+        self._position_key = None
+        self._position = None
+
+    def apply(self, image: Image.Image, scale: int, draw: ImageDraw.ImageDraw = None) -> None:
+        # pylint: disable=protected-access
+        if draw is None:
+            draw = ImageDraw.Draw(image)
+        tile_key = self.text._tile_key()
+        if tile_key != self._tile_key:
+            self._tile = _render_text_tile(*tile_key)
+            self._tile_key = tile_key
+            self._position_key = None
+        position_key = (image.size, self.text.position)
+        if position_key != self._position_key:
+            self._position = self.text._tile_position((0, 0, image.width, image.height), self._tile)
+            self._position_key = position_key
+        self.text._draw_tile(draw, self._position, self._tile)
 
 
 class _AnnotatorHelper(Annotator):  # pylint: disable=too-few-public-methods
@@ -376,7 +490,7 @@ class _AnnotatorHelper(Annotator):  # pylint: disable=too-few-public-methods
         super().__init__(img_annotator)
         self._wrapped = wrapped
 
-    def apply(self, image: Image.Image, scale: int) -> None:
+    def apply(self, image: Image.Image, scale: int) -> None:  # pylint: disable=arguments-differ
         self._wrapped(image, scale, world=self.world, img_annotator=self.img_annotator)
 
 
@@ -455,6 +569,7 @@ class ImageAnnotator:
 
         self._annotators = {}
         self._sorted_annotators = []
+        self._active_annotators = []
         self.add_annotator('objects', ObjectAnnotator(self))
         self.add_annotator('faces', FaceAnnotator(self))
 
@@ -465,6 +580,14 @@ class ImageAnnotator:
     def _sort_annotators(self):
         self._sorted_annotators = sorted(self._annotators.values(),
                                          key=lambda an: an.priority, reverse=True)
+        self._update_active_annotators()
+
+    def _update_active_annotators(self):
+        """Refresh the list of enabled annotators applied to each image, in priority order.
+
+        Each entry is paired with whether the annotator's apply method accepts the shared draw argument.
+        """
+        self._active_annotators = [(an, _apply_accepts_draw(type(an))) for an in self._sorted_annotators if an.enabled]
 
     def add_annotator(self, name: str, new_annotator: Union[Annotator, Callable[..., Annotator]]) -> None:
         """Adds a new annotator for display.
@@ -557,10 +680,12 @@ class ImageAnnotator:
         :param resample_mode: The resampling mode to use when scaling the
             image. Should be either :attr:`RESAMPLE_MODE_NEAREST` (fast) or
             :attr:`RESAMPLE_MODE_BILINEAR` (slower, but smoother).
+        :returns: The annotated image. If the image is not scaled and no annotations
+            are applied, this is the image that was passed in rather than a copy.
         """
+        new_size = None
         if scale is not None and scale != 1:
-            image = image.resize((int(image.width * scale), int(image.height * scale)),
-                                 resample=resample_mode)
+            new_size = (int(image.width * scale), int(image.height * scale))
 
         elif fit_size is not None and fit_size != (image.width, image.height):
             img_ratio = image.width / image.height
@@ -571,17 +696,25 @@ class ImageAnnotator:
             elif img_ratio < fit_ratio:
                 fit_width = int(fit_height * img_ratio)
             scale = fit_width / image.width
-            image = image.resize((fit_width, fit_height))
+            new_size = (fit_width, fit_height)
+
+        if new_size is not None and new_size != (image.width, image.height):
+            image = image.resize(new_size, resample=resample_mode)
 
         else:
             scale = 1
-            image = image.copy()
+            if self.annotation_enabled and self._active_annotators:
+                # Only copy when annotating, to leave the caller's image untouched
+                image = image.copy()
 
         if not self.annotation_enabled:
             return image
 
-        for an in self._sorted_annotators:
-            if an.enabled:
+        draw = ImageDraw.Draw(image)
+        for an, accepts_draw in self._active_annotators:
+            if accepts_draw:
+                an.apply(image, scale, draw=draw)
+            else:
                 an.apply(image, scale)
 
         return image
@@ -26,7 +26,9 @@ __all__ = ['AudioComponent']
 import asyncio
 from concurrent import futures
 from enum import Enum
-import time
+import io
+import logging
+import struct
 import wave
 from google.protobuf.text_format import MessageToString
 from . import util
@@ -38,6 +40,48 @@ from .messaging import protocol
 MAX_ROBOT_AUDIO_CHUNK_SIZE = 1024  # 1024 is maximum, larger sizes will fail
 DEFAULT_FRAME_SIZE = MAX_ROBOT_AUDIO_CHUNK_SIZE // 2
 
+MIN_ROBOT_AUDIO_FRAME_RATE = 8000
+MAX_ROBOT_AUDIO_FRAME_RATE = 16025
+
+# RIFF header, WAVE id, 16 byte PCM fmt chunk and the data chunk header of a canonical .wav file
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+_WAVE_FORMAT_PCM = 0x0001
+
+# Low-pass filter applied before downsampling. The cutoff is a fraction of the new Nyquist
+# frequency, leaving room for the filter's transition band.
+_ANTI_ALIAS_TAPS = 101
+_ANTI_ALIAS_CUTOFF = 0.9
+
+# asyncio.get_running_loop is new in Python 3.7; inside a coroutine get_event_loop returns the same loop on 3.6
+_get_running_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+
+
+def _resample(audio_data: bytes, from_rate: int, to_rate: int) -> bytes:
+    """Resample 16 bit mono samples from one frame rate to another.
+
+    Samples are linearly interpolated. When downsampling, they are first low-pass filtered
+    below the new Nyquist frequency so higher frequencies don't alias. The result is an
+    approximation, good enough for playing on Vector's speaker.
+    """
+    # numpy is only needed for files the robot can't play as they are, so it is imported here
+    import numpy as np
+
+    samples = np.frombuffer(audio_data, dtype='<i2', count=len(audio_data) // 2).astype(np.float64)
+    if not len(samples):
+        return b''
+    if to_rate < from_rate:
+        # Hamming windowed sinc, with the cutoff in cycles per input sample
+        cutoff = _ANTI_ALIAS_CUTOFF * 0.5 * to_rate / from_rate
+        taps = np.arange(_ANTI_ALIAS_TAPS) - (_ANTI_ALIAS_TAPS - 1) / 2
+        kernel = np.sinc(2 * cutoff * taps) * np.hamming(_ANTI_ALIAS_TAPS)
+        kernel /= kernel.sum()
+        # keep the centre of the full convolution, so the filtered samples line up with the input
+        offset = (_ANTI_ALIAS_TAPS - 1) // 2
+        samples = np.convolve(samples, kernel)[offset:offset + len(samples)]
+    positions = np.arange(len(samples) * to_rate // from_rate) * (from_rate / to_rate)
+    resampled = np.interp(positions, np.arange(len(samples)), samples)
+    return np.clip(np.rint(resampled), -32768, 32767).astype('<i2').tobytes()
+
 
 class RobotVolumeLevel(Enum):
     """Use these values for setting the master audio volume.  See :meth:`set_master_volume`
@@ -73,6 +117,7 @@ class AudioComponent(util.Component):
         # don't create asyncio.Events here, they are not thread-safe
         self._is_active_event = None
         self._done_event = None
+        self._events_loop = None
 
     @on_connection_thread(requires_control=False)
     async def set_master_volume(self, volume: RobotVolumeLevel) -> protocol.MasterVolumeResponse:
@@ -95,60 +140,85 @@ class AudioComponent(util.Component):
         return await self.conn.grpc_interface.SetMasterVolume(volume_request)
 
     def _open_file(self, filename):
-        _reader = wave.open(filename, 'rb')
-        _params = _reader.getparams()
+        with open(filename, 'rb') as _file:
+            _wav_data = _file.read()
         self.logger.info("Playing audio file %s", filename)
 
-        if _params.sampwidth != 2 or _params.nchannels != 1 or _params.framerate > 16025 or _params.framerate < 8000:
+        _header = _wav_data[:_WAV_HEADER.size]
+        _fields = _WAV_HEADER.unpack(_header) if len(_header) == _WAV_HEADER.size else None
+        if (_fields is not None and _fields[0] == b'RIFF' and _fields[2] == b'WAVE' and _fields[3] == b'fmt '
+                and _fields[4] == 16 and _fields[5] == _WAVE_FORMAT_PCM and _fields[11] == b'data'):
+            # Canonical 44 byte header: the samples follow it directly
+            _nchannels, _framerate, _sampwidth = _fields[6], _fields[7], (_fields[10] + 7) // 8
+            _audio_data = _wav_data[_WAV_HEADER.size:_WAV_HEADER.size + _fields[12]]
+        else:
+            # Extra chunks or an extended format header, leave parsing to the wave module
+            with wave.open(io.BytesIO(_wav_data), 'rb') as _reader:
+                _params = _reader.getparams()
+                _nchannels, _framerate, _sampwidth = _params.nchannels, _params.framerate, _params.sampwidth
+                _audio_data = _reader.readframes(_params.nframes)
+
+        if _sampwidth != 2 or _nchannels != 1 or _framerate <= 0:
             raise VectorExternalAudioPlaybackException(
-                f"Audio format must be 8000-16025 hz, 16 bits, 1 channel.  "
-                f"Found {_params.framerate} hz/{_params.sampwidth*8} bits/{_params.nchannels} channels")
+                f"Audio format must be 16 bits, 1 channel.  "
+                f"Found {_framerate} hz/{_sampwidth*8} bits/{_nchannels} channels")
 
-        return _reader, _params
+        if _framerate > MAX_ROBOT_AUDIO_FRAME_RATE or _framerate < MIN_ROBOT_AUDIO_FRAME_RATE:
+            _target_framerate = 16000 if _framerate > MAX_ROBOT_AUDIO_FRAME_RATE else MIN_ROBOT_AUDIO_FRAME_RATE
+            self.logger.info("Resampling audio file from %d hz to %d hz", _framerate, _target_framerate)
+            _audio_data = _resample(_audio_data, _framerate, _target_framerate)
+            _framerate = _target_framerate
 
-    async def _request_handler(self, reader, params, volume):
+        return _audio_data, _framerate
+
+    async def _request_handler(self, audio_data, framerate, volume):
         """Handles generating request messages for the AudioPlaybackStream."""
-        frames = params.nframes  # 16 bit samples, not bytes
+        # only whole 16 bit samples are sent
+        total_bytes = len(audio_data) & ~1
+        bytes_sent = 0
 
         # send preparation message
-        msg = protocol.ExternalAudioStreamPrepare(audio_frame_rate=params.framerate, audio_volume=volume)
+        msg = protocol.ExternalAudioStreamPrepare(audio_frame_rate=framerate, audio_volume=volume)
         msg = protocol.ExternalAudioStreamRequest(audio_stream_prepare=msg)
 
         yield msg
-        await asyncio.sleep(0)  # give event loop a chance to process messages
-
-        # count of full and partial chunks
-        total_chunks = (frames + DEFAULT_FRAME_SIZE - 1) // DEFAULT_FRAME_SIZE
-        curr_chunk = 0
-        start_time = time.time()
-        self.logger.debug("Starting stream time %f", start_time)
-
-        while frames > 0 and not self._done_event.is_set():
-            read_count = min(frames, DEFAULT_FRAME_SIZE)
-            audio_data = reader.readframes(read_count)
-            msg = protocol.ExternalAudioStreamChunk(audio_chunk_size_bytes=len(audio_data), audio_chunk_samples=audio_data)
-            msg = protocol.ExternalAudioStreamRequest(audio_stream_chunk=msg)
-            yield msg
-            await asyncio.sleep(0)
+
+        # Pace the stream against the loop's monotonic clock. stream_end is when
+        # the audio sent before the current chunk will have finished playing.
+        loop = _get_running_loop()
+        chunk_duration = DEFAULT_FRAME_SIZE / framerate
+        stream_end = loop.time()
+        self.logger.debug("Starting stream time %f", stream_end)
+
+        # gRPC serializes each request before asking for the next one, so a single
+        # chunk request can be refilled and yielded again for every chunk
+        chunk_request = protocol.ExternalAudioStreamRequest()
+        chunk = chunk_request.audio_stream_chunk  # pylint: disable=no-member
+
+        # bound once, these are used for every chunk
+        done_is_set = self._done_event.is_set
+        loop_time = loop.time
+        chunk_size = MAX_ROBOT_AUDIO_CHUNK_SIZE
+
+        while bytes_sent < total_bytes and not done_is_set():
+            chunk_data = audio_data[bytes_sent:min(bytes_sent + chunk_size, total_bytes)]
+            chunk.audio_chunk_size_bytes = len(chunk_data)
+            chunk.audio_chunk_samples = chunk_data
+            yield chunk_request
 
             # check if streaming is way ahead of audio playback time
-            elapsed = time.time() - start_time
-            expected_data_count = elapsed * params.framerate
-            time_ahead = (curr_chunk * DEFAULT_FRAME_SIZE - expected_data_count) / params.framerate
+            time_ahead = stream_end - loop_time()
             if time_ahead > 1.0:
-                self.logger.debug("waiting %f to catchup chunk %f", time_ahead - 0.5, curr_chunk)
+                self.logger.debug("waiting %f to catchup at sample %d", time_ahead - 0.5, bytes_sent // 2)
                 await asyncio.sleep(time_ahead - 0.5)
-            frames = frames - read_count
-            curr_chunk += 1
-            if curr_chunk == total_chunks:
+            stream_end += chunk_duration
+            bytes_sent += len(chunk_data)
+            if bytes_sent >= total_bytes:
                 # last chunk:  time to stop stream
                 msg = protocol.ExternalAudioStreamComplete()
                 msg = protocol.ExternalAudioStreamRequest(audio_stream_complete=msg)
 
                 yield msg
-                await asyncio.sleep(0)
-
-        reader.close()
 
         # Need the done message from the robot
         await self._done_event.wait()
@@ -165,29 +235,35 @@ class AudioComponent(util.Component):
             with anki_vector.Robot() as robot:
                 robot.audio.stream_wav_file('../examples/sounds/vector_alert.wav')
 
+        Files must be 16 bit mono.  Files outside of the 8000-16025 hz range that Vector
+        can play are resampled to 16000 hz, or 8000 hz for lower rates, before streaming.
+
         :param filename: the filename/path to the .wav audio file
         :param volume: the audio playback level (0-100)
         """
 
         # TODO make this support multiple simultaneous sound playback
-        if self._is_active_event is None:
+        # The events are bound to the loop they were created on, so they are only
+        # created once per connection and cleared again after each playback
+        if self._events_loop is not self.conn.loop:
+            self._events_loop = self.conn.loop
             self._is_active_event = asyncio.Event()
+            self._done_event = asyncio.Event()
 
         if self._is_active_event.is_set():
             raise VectorExternalAudioPlaybackException("Cannot start audio when another sound is playing")
 
         if volume < 0 or volume > 100:
             raise VectorExternalAudioPlaybackException("Volume must be between 0 and 100")
-        _file_reader, _file_params = self._open_file(filename)
         playback_error = None
         self._is_active_event.set()
 
-        if self._done_event is None:
-            self._done_event = asyncio.Event()
-
         try:
-            async for response in self.grpc_interface.ExternalAudioStreamPlayback(self._request_handler(_file_reader, _file_params, volume)):
-                self.logger.info("ExternalAudioStream %s", MessageToString(response, as_one_line=True))
+            # Read (and if needed resample) the file on a worker thread, to keep the connection loop responsive
+            _file_data, _file_framerate = await self.conn.loop.run_in_executor(None, self._open_file, filename)
+            async for response in self.grpc_interface.ExternalAudioStreamPlayback(self._request_handler(_file_data, _file_framerate, volume)):
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("ExternalAudioStream %s", MessageToString(response, as_one_line=True))
                 response_type = response.WhichOneof("audio_response_type")
                 if response_type == 'audio_stream_playback_complete':
                     playback_error = None
@@ -201,8 +277,8 @@ class AudioComponent(util.Component):
         except futures.CancelledError:
             self.logger.debug('Audio Stream handler task was cancelled.')
         finally:
-            self._is_active_event = None
-            self._done_event = None
+            self._is_active_event.clear()
+            self._done_event.clear()
 
         if playback_error is not None:
             raise VectorExternalAudioPlaybackException(f"Error reported during audio playback {playback_error}")
@@ -39,6 +39,9 @@ __all__ = ["MAX_HEAD_ANGLE", "MIN_HEAD_ANGLE",
            "BehaviorComponent", "ReserveBehaviorControl"]
 
 
+import itertools
+import logging
+
 from . import connection, faces, objects, util
 from .messaging import protocol
 from .exceptions import VectorException
@@ -51,6 +54,13 @@ MIN_HEAD_ANGLE = util.degrees(-22.0)
 #: The maximum angle the robot's head can be set to
 MAX_HEAD_ANGLE = util.degrees(45.0)
 
+# The head angle limits in radians, for clamping requested angles
+_MIN_HEAD_ANGLE_RAD = MIN_HEAD_ANGLE.radians
+_MAX_HEAD_ANGLE_RAD = MAX_HEAD_ANGLE.radians
+
+# The furthest turn_towards_face lets Vector turn to find the face, in radians
+_MAX_TURN_TOWARDS_FACE_RAD = util.degrees(180).radians
+
 # The lowest height-above-ground that lift can be moved to in millimeters.
 MIN_LIFT_HEIGHT_MM = 32.0
 
@@ -63,21 +73,30 @@ MAX_LIFT_HEIGHT_MM = 92.0
 #: The largest height-above-ground that lift can be moved to
 MAX_LIFT_HEIGHT = util.distance_mm(MAX_LIFT_HEIGHT_MM)
 
+# The distance the lift travels between its lowest and highest positions in millimeters.
+_LIFT_HEIGHT_RANGE_MM = MAX_LIFT_HEIGHT_MM - MIN_LIFT_HEIGHT_MM
+
+# These requests have no fields, and gRPC only ever serializes them, so a single instance of each is shared
+_DRIVE_OFF_CHARGER_REQUEST = protocol.DriveOffChargerRequest()
+_DRIVE_ON_CHARGER_REQUEST = protocol.DriveOnChargerRequest()
+_FIND_FACES_REQUEST = protocol.FindFacesRequest()
+_LOOK_AROUND_IN_PLACE_REQUEST = protocol.LookAroundInPlaceRequest()
+_ROLL_BLOCK_REQUEST = protocol.RollBlockRequest()
+
 
 class BehaviorComponent(util.Component):
     """Run behaviors on Vector"""
 
-    _next_behavior_id = protocol.FIRST_SDK_TAG
+    __slots__ = ()
+
+    # next() on an itertools.count is atomic, so no lock is needed when behaviors start on several threads
+    _behavior_id_counter = itertools.count()
+    _SDK_TAG_RANGE = protocol.LAST_SDK_TAG - protocol.FIRST_SDK_TAG + 1
 
     @classmethod
     def _get_next_behavior_id(cls):
-        # Post increment _current_behavior_id (and loop within the SDK_TAG range)
-        next_behavior_id = cls._next_behavior_id
-        if cls._next_behavior_id == protocol.LAST_SDK_TAG:
-            cls._next_behavior_id = protocol.FIRST_SDK_TAG
-        else:
-            cls._next_behavior_id += 1
-        return next_behavior_id
+        # Loop within the SDK_TAG range
+        return protocol.FIRST_SDK_TAG + next(cls._behavior_id_counter) % cls._SDK_TAG_RANGE
 
     @connection.on_connection_thread()
     async def _abort(self, behavior_id):
@@ -99,8 +118,7 @@ class BehaviorComponent(util.Component):
             with anki_vector.Robot() as robot:
                 robot.behavior.drive_off_charger()
         """
-        drive_off_charger_request = protocol.DriveOffChargerRequest()
-        return await self.grpc_interface.DriveOffCharger(drive_off_charger_request)
+        return await self.grpc_interface.DriveOffCharger(_DRIVE_OFF_CHARGER_REQUEST)
 
     # TODO Make this cancellable with is_cancellable_behavior
     @connection.on_connection_thread()
@@ -120,8 +138,7 @@ class BehaviorComponent(util.Component):
             with anki_vector.Robot() as robot:
                 robot.behavior.drive_on_charger()
         """
-        drive_on_charger_request = protocol.DriveOnChargerRequest()
-        return await self.grpc_interface.DriveOnCharger(drive_on_charger_request)
+        return await self.grpc_interface.DriveOnCharger(_DRIVE_ON_CHARGER_REQUEST)
 
     # TODO Make this cancellable with is_cancellable_behavior
     @connection.on_connection_thread()
@@ -137,8 +154,7 @@ class BehaviorComponent(util.Component):
             with anki_vector.Robot() as robot:
                 robot.behavior.find_faces()
         """
-        find_faces_request = protocol.FindFacesRequest()
-        return await self.grpc_interface.FindFaces(find_faces_request)
+        return await self.grpc_interface.FindFaces(_FIND_FACES_REQUEST)
 
     # TODO Make this cancellable with is_cancellable_behavior
     @connection.on_connection_thread()
@@ -154,8 +170,7 @@ class BehaviorComponent(util.Component):
             with anki_vector.Robot() as robot:
                 robot.behavior.look_around_in_place()
         """
-        look_around_in_place_request = protocol.LookAroundInPlaceRequest()
-        return await self.grpc_interface.LookAroundInPlace(look_around_in_place_request)
+        return await self.grpc_interface.LookAroundInPlace(_LOOK_AROUND_IN_PLACE_REQUEST)
 
     # TODO Make this cancellable with is_cancellable_behavior
     @connection.on_connection_thread()
@@ -174,8 +189,7 @@ class BehaviorComponent(util.Component):
             with anki_vector.Robot() as robot:
                 robot.behavior.roll_visible_cube()
         """
-        roll_block_request = protocol.RollBlockRequest()
-        return await self.grpc_interface.RollBlock(roll_block_request)
+        return await self.grpc_interface.RollBlock(_ROLL_BLOCK_REQUEST)
 
     # TODO Make this cancellable with is_cancellable_behavior
     @connection.on_connection_thread()
@@ -286,11 +300,14 @@ class BehaviorComponent(util.Component):
         if relative_to_robot and self.robot.pose:
             pose = self.robot.pose.define_pose_relative_this(pose)
 
-        go_to_pose_request = protocol.GoToPoseRequest(x_mm=pose.position.x,
-                                                      y_mm=pose.position.y,
-                                                      rad=pose.rotation.angle_z.radians,
-                                                      id_tag=_behavior_id,
-                                                      num_retries=num_retries)
+        # Assigning fields directly is cheaper than passing them as keyword arguments,
+        # and every field is assigned so the reused request needs no Clear()
+        go_to_pose_request = self._scratch_request(protocol.GoToPoseRequest)
+        go_to_pose_request.x_mm = pose.position.x
+        go_to_pose_request.y_mm = pose.position.y
+        go_to_pose_request.rad = pose.rotation.angle_z.radians
+        go_to_pose_request.id_tag = _behavior_id
+        go_to_pose_request.num_retries = num_retries
 
         return await self.grpc_interface.GoToPose(go_to_pose_request)
 
@@ -421,11 +438,12 @@ class BehaviorComponent(util.Component):
                 time.sleep(2.0)
                 drive_future.cancel()
         """
-        drive_straight_request = protocol.DriveStraightRequest(speed_mmps=speed.speed_mmps,
-                                                               dist_mm=distance.distance_mm,
-                                                               should_play_animation=should_play_anim,
-                                                               id_tag=_behavior_id,
-                                                               num_retries=num_retries)
+        drive_straight_request = self._scratch_request(protocol.DriveStraightRequest)
+        drive_straight_request.speed_mmps = speed.speed_mmps
+        drive_straight_request.dist_mm = distance.distance_mm
+        drive_straight_request.should_play_animation = should_play_anim
+        drive_straight_request.id_tag = _behavior_id
+        drive_straight_request.num_retries = num_retries
 
         return await self.grpc_interface.DriveStraight(drive_straight_request)
 
@@ -482,13 +500,14 @@ class BehaviorComponent(util.Component):
                 time.sleep(0.5)
                 turn_future.cancel()
         """
-        turn_in_place_request = protocol.TurnInPlaceRequest(angle_rad=angle.radians,
-                                                            speed_rad_per_sec=speed.radians,
-                                                            accel_rad_per_sec2=accel.radians,
-                                                            tol_rad=angle_tolerance.radians,
-                                                            is_absolute=is_absolute,
-                                                            id_tag=_behavior_id,
-                                                            num_retries=num_retries)
+        turn_in_place_request = self._scratch_request(protocol.TurnInPlaceRequest)
+        turn_in_place_request.angle_rad = angle.radians
+        turn_in_place_request.speed_rad_per_sec = speed.radians
+        turn_in_place_request.accel_rad_per_sec2 = accel.radians
+        turn_in_place_request.tol_rad = angle_tolerance.radians
+        turn_in_place_request.is_absolute = is_absolute
+        turn_in_place_request.id_tag = _behavior_id
+        turn_in_place_request.num_retries = num_retries
 
         return await self.grpc_interface.TurnInPlace(turn_in_place_request)
 
@@ -545,21 +564,19 @@ class BehaviorComponent(util.Component):
                 head_future = robot.behavior.set_head_angle(MIN_HEAD_ANGLE)
                 head_future.cancel()
         """
-        if angle < MIN_HEAD_ANGLE:
-            self.logger.warning("head angle %s too small, should be in %f..%f range - clamping",
-                                angle.degrees, MIN_HEAD_ANGLE.degrees, MAX_HEAD_ANGLE.degrees)
-            angle = MIN_HEAD_ANGLE
-        elif angle > MAX_HEAD_ANGLE:
-            self.logger.warning("head angle %s too large, should be in %f..%f range - clamping",
-                                angle.degrees, MIN_HEAD_ANGLE.degrees, MAX_HEAD_ANGLE.degrees)
-            angle = MAX_HEAD_ANGLE
-
-        set_head_angle_request = protocol.SetHeadAngleRequest(angle_rad=angle.radians,
-                                                              max_speed_rad_per_sec=max_speed,
-                                                              accel_rad_per_sec2=accel,
-                                                              duration_sec=duration,
-                                                              id_tag=_behavior_id,
-                                                              num_retries=num_retries)
+        angle_rad = min(max(angle.radians, _MIN_HEAD_ANGLE_RAD), _MAX_HEAD_ANGLE_RAD)
+        if angle_rad != angle.radians and self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning("head angle %s too %s, should be in %f..%f range - clamping",
+                                angle.degrees, "small" if angle_rad == _MIN_HEAD_ANGLE_RAD else "large",
+                                MIN_HEAD_ANGLE.degrees, MAX_HEAD_ANGLE.degrees)
+
+        set_head_angle_request = self._scratch_request(protocol.SetHeadAngleRequest)
+        set_head_angle_request.angle_rad = angle_rad
+        set_head_angle_request.max_speed_rad_per_sec = max_speed
+        set_head_angle_request.accel_rad_per_sec2 = accel
+        set_head_angle_request.duration_sec = duration
+        set_head_angle_request.id_tag = _behavior_id
+        set_head_angle_request.num_retries = num_retries
         return await self.grpc_interface.SetHeadAngle(set_head_angle_request)
 
     @connection.on_connection_thread(is_cancellable_behavior=True)
@@ -608,21 +625,18 @@ class BehaviorComponent(util.Component):
                 lift_future = robot.behavior.set_lift_height(1.0)
                 lift_future.cancel()
         """
-        if height < 0.0:
-            self.logger.warning("lift height %s too small, should be in 0..1 range - clamping", height)
-            height = MIN_LIFT_HEIGHT_MM
-        elif height > 1.0:
-            self.logger.warning("lift height %s too large, should be in 0..1 range - clamping", height)
-            height = MAX_LIFT_HEIGHT_MM
-        else:
-            height = MIN_LIFT_HEIGHT_MM + (height * (MAX_LIFT_HEIGHT_MM - MIN_LIFT_HEIGHT_MM))
-
-        set_lift_height_request = protocol.SetLiftHeightRequest(height_mm=height,
-                                                                max_speed_rad_per_sec=max_speed,
-                                                                accel_rad_per_sec2=accel,
-                                                                duration_sec=duration,
-                                                                id_tag=_behavior_id,
-                                                                num_retries=num_retries)
+        clamped_height = min(max(height, 0.0), 1.0)
+        if clamped_height != height and self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning("lift height %s too %s, should be in 0..1 range - clamping",
+                                height, "small" if clamped_height == 0.0 else "large")
+
+        set_lift_height_request = self._scratch_request(protocol.SetLiftHeightRequest)
+        set_lift_height_request.height_mm = MIN_LIFT_HEIGHT_MM + clamped_height * _LIFT_HEIGHT_RANGE_MM
+        set_lift_height_request.max_speed_rad_per_sec = max_speed
+        set_lift_height_request.accel_rad_per_sec2 = accel
+        set_lift_height_request.duration_sec = duration
+        set_lift_height_request.id_tag = _behavior_id
+        set_lift_height_request.num_retries = num_retries
 
         return await self.grpc_interface.SetLiftHeight(set_lift_height_request)
 
@@ -657,7 +671,7 @@ class BehaviorComponent(util.Component):
                 turn_towards_face_future.cancel()
         """
         turn_towards_face_request = protocol.TurnTowardsFaceRequest(face_id=face.face_id,
-                                                                    max_turn_angle_rad=util.degrees(180).radians,
+                                                                    max_turn_angle_rad=_MAX_TURN_TOWARDS_FACE_RAD,
                                                                     id_tag=_behavior_id,
                                                                     num_retries=num_retries)
 
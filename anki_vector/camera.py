@@ -39,11 +39,6 @@ from .events import Events
 from .exceptions import VectorCameraFeedException
 from .messaging import protocol
 
-try:
-    import numpy as np
-except ImportError:
-    sys.exit("Cannot import numpy: Do `pip3 install numpy` to install")
-
 try:
     from PIL import Image
 except ImportError:
@@ -52,14 +47,18 @@ except ImportError:
 
 def _convert_to_pillow_image(image_data: bytes) -> Image.Image:
     """Convert raw image bytes to a Pillow Image."""
-    size = len(image_data)
+    # Decode compressed source data into uncompressed image data
+    image = Image.open(io.BytesIO(image_data))
+    return image
 
-    # Constuct numpy array out of source data
-    array = np.empty(size, dtype=np.uint8)
-    array[0:size] = list(image_data)
 
-    # Decode compressed source data into uncompressed image data
-    image = Image.open(io.BytesIO(array))
+def _decode_pillow_image(image_data: bytes) -> Image.Image:
+    """Convert raw image bytes to a Pillow Image, decoding the pixel data straight away.
+
+    Pillow releases the GIL while decoding, so this can run on a worker thread.
+    """
+    image = _convert_to_pillow_image(image_data)
+    image.load()
     return image
 
 
@@ -128,11 +127,17 @@ class CameraImage:
             image. Should be either :attr:`~anki_vector.annotate.RESAMPLE_MODE_NEAREST`
             (fast) or :attr:`~anki_vector.annotate.RESAMPLE_MODE_BILINEAR` (slower,
             but smoother).
+        :returns: A new annotated image. The raw image is never modified.
         """
-        return self._image_annotator.annotate_image(self._raw_image,
-                                                    scale=scale,
-                                                    fit_size=fit_size,
-                                                    resample_mode=resample_mode)
+        image = self._image_annotator.annotate_image(self._raw_image,
+                                                     scale=scale,
+                                                     fit_size=fit_size,
+                                                     resample_mode=resample_mode)
+        if image is self._raw_image:
+            # With nothing to scale or annotate the annotator returns its input, so copy it
+            # to keep drawing on the result from changing raw_image
+            image = image.copy()
+        return image
 
 
 class CameraComponent(util.Component):
@@ -298,10 +303,8 @@ class CameraComponent(util.Component):
         future = self.conn.run_coroutine(self._image_streaming_enabled())
         return future.result()
 
-    def _unpack_image(self, msg: protocol.CameraFeedResponse) -> None:
+    def _unpack_image(self, msg: protocol.CameraFeedResponse, image: Image.Image) -> None:
         """Processes raw data from the robot into a more useful image structure."""
-        image = _convert_to_pillow_image(msg.data)
-
         self._latest_image = CameraImage(image, self._image_annotator, msg.image_id)
         self._latest_image_id = msg.image_id
 
@@ -325,7 +328,9 @@ class CameraComponent(util.Component):
                 if not self._enabled:
                     self.logger.warning('Camera feed has been disabled. Enable the feed to start/continue receiving camera feed data')
                     return
-                self._unpack_image(evt)
+                # Decode on a worker thread, so each frame doesn't hold up the connection loop
+                image = await self.conn.loop.run_in_executor(None, _decode_pillow_image, evt.data)
+                self._unpack_image(evt, image)
         except CancelledError:
             self.logger.debug('Camera feed task was cancelled. This is expected during disconnection.')
 
@@ -217,7 +217,7 @@ class Connection:
         self._done_signal: asyncio.Event = None
         self._conn_exception = False
         self._behavior_control_level = behavior_control_level
-        self.active_commands = []
+        self.active_commands = set()
 
     @property
     def loop(self) -> asyncio.BaseEventLoop:
@@ -582,10 +582,12 @@ class Connection:
             self._logger.debug('Behavior handler task was cancelled. This is expected during disconnection.')
 
     def _cancel_active(self):
-        for fut in self.active_commands:
+        # Swap in a fresh set first: cancelling runs each future's done callbacks,
+        # which remove it from active_commands while it is being walked
+        active_commands, self.active_commands = self.active_commands, set()
+        for fut in active_commands:
             if not fut.done():
                 fut.cancel()
-        self.active_commands = []
 
     def close(self):
         """Cleanup the connection, and shutdown all the event handlers.
@@ -742,15 +744,19 @@ def on_connection_thread(log_messaging: bool = True, requires_control: bool = Tr
                     raise VectorControlException(func.__name__)
                 logger.info(f"Delaying {func.__name__} until behavior control is granted")
                 await asyncio.wait([conn.control_granted_event.wait()], timeout=10)
-            message = args[1:]
-            outgoing = message if log_messaging else "size = {} bytes".format(sys.getsizeof(message))
-            logger.debug(f'Outgoing {func.__name__}: {outgoing}')
+            # Formatting the messages is costly, so only do it when they will be logged
+            log_debug = logger.isEnabledFor(logging.DEBUG)
+            if log_debug:
+                message = args[1:]
+                outgoing = message if log_messaging else "size = {} bytes".format(sys.getsizeof(message))
+                logger.debug(f'Outgoing {func.__name__}: {outgoing}')
             try:
                 result = await func(*args, **kwargs)
             except grpc.RpcError as rpc_error:
                 raise connection_error(rpc_error) from rpc_error
-            incoming = str(result).strip() if log_messaging else "size = {} bytes".format(sys.getsizeof(result))
-            logger.debug(f'Incoming {func.__name__}: {type(result).__name__}  {incoming}')
+            if log_debug:
+                incoming = str(result).strip() if log_messaging else "size = {} bytes".format(sys.getsizeof(result))
+                logger.debug(f'Incoming {func.__name__}: {type(result).__name__}  {incoming}')
             return result
 
         @functools.wraps(func)
@@ -794,11 +800,10 @@ def on_connection_thread(log_messaging: bool = True, requires_control: bool = Tr
                 future.add_done_callback(user_cancelled)
 
             if requires_control:
-                self.conn.active_commands.append(future)
+                self.conn.active_commands.add(future)
 
                 def clear_when_done(fut):
-                    if fut in self.conn.active_commands:
-                        self.conn.active_commands.remove(fut)
+                    self.conn.active_commands.discard(fut)
                 future.add_done_callback(clear_when_done)
             if _return_future:
                 return future
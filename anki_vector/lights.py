@@ -185,6 +185,16 @@ def package_request_params(lights, color_profile):
     return merged_params
 
 
+def _package_uniform_request_params(light, count, color_profile):
+    """Package request params for ``count`` lights that all share the same settings.
+
+    Equivalent to ``package_request_params((light,) * count, color_profile)``, but the
+    light's colors are only augmented once.
+    """
+    return {attr_name: attr_vals * count
+            for attr_name, attr_vals in package_request_params((light,), color_profile).items()}
+
+
 #: :class:`Light`: A steady green colored LED light.
 green_light = Light(on_color=green)
 
@@ -517,22 +517,10 @@ class LightCube(ObservableObject):
         :param color_profile: The profile to be used for the cube lights
         """
         params = lights.package_request_params((light1, light2, light3, light4), color_profile)
-        req = protocol.SetCubeLightsRequest(
-            object_id=self._object_id,
-            on_color=params['on_color'],
-            off_color=params['off_color'],
-            on_period_ms=params['on_period_ms'],
-            off_period_ms=params['off_period_ms'],
-            transition_on_period_ms=params['transition_on_period_ms'],
-            transition_off_period_ms=params['transition_off_period_ms'],
-            offset=[0, 0, 0, 0],
-            relative_to_x=0.0,
-            relative_to_y=0.0,
-            rotate=False,
-            make_relative=protocol.SetCubeLightsRequest.OFF)  # pylint: disable=no-member
-        return await self.grpc_interface.SetCubeLights(req)
+        return await self.grpc_interface.SetCubeLights(self._cube_lights_request(params))
 
-    def set_lights(self, light: lights.Light, color_profile: lights.ColorProfile = lights.WHITE_BALANCED_CUBE_PROFILE):
+    @connection.on_connection_thread()
+    async def set_lights(self, light: lights.Light, color_profile: lights.ColorProfile = lights.WHITE_BALANCED_CUBE_PROFILE):
         """Set all lights on the cube
 
         .. testcode::
@@ -556,7 +544,8 @@ class LightCube(ObservableObject):
         :param light: The settings for the lights
         :param color_profile: The profile to be used for the cube lights
         """
-        return self.set_light_corners(light, light, light, light, color_profile)
+        params = lights._package_uniform_request_params(light, 4, color_profile)  # pylint: disable=protected-access
+        return await self.grpc_interface.SetCubeLights(self._cube_lights_request(params))
 
     def set_lights_off(self, color_profile: lights.ColorProfile = lights.WHITE_BALANCED_CUBE_PROFILE):
         """Set all lights off on the cube
@@ -583,10 +572,25 @@ class LightCube(ObservableObject):
         :param color_profile: The profile to be used for the cube lights
         """
 
-        return self.set_light_corners(lights.off_light, lights.off_light, lights.off_light, lights.off_light, color_profile)
+        return self.set_lights(lights.off_light, color_profile)
 
     #### Private Methods ####
 
+    def _cube_lights_request(self, params):
+        return protocol.SetCubeLightsRequest(
+            object_id=self._object_id,
+            on_color=params['on_color'],
+            off_color=params['off_color'],
+            on_period_ms=params['on_period_ms'],
+            off_period_ms=params['off_period_ms'],
+            transition_on_period_ms=params['transition_on_period_ms'],
+            transition_off_period_ms=params['transition_off_period_ms'],
+            offset=[0, 0, 0, 0],
+            relative_to_x=0.0,
+            relative_to_y=0.0,
+            rotate=False,
+            make_relative=protocol.SetCubeLightsRequest.OFF)  # pylint: disable=no-member
+
     def _repr_values(self):
         return 'object_id=%s' % self.object_id
 
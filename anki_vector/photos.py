@@ -19,7 +19,6 @@ Photo related classes, functions, events and values.
 # __all__ should order by constants, event classes, other classes, functions.
 __all__ = ["PhotographComponent"]
 
-import concurrent
 from typing import List
 
 from . import connection, util
@@ -66,9 +65,8 @@ class PhotographComponent(util.Component):
         """
         if not self._photo_info:
             self.logger.debug("Photo list was empty. Lazy-loading photo list now.")
-            result = self.load_photo_info()
-            if isinstance(result, concurrent.futures.Future):
-                result.result()
+            # Block until loaded regardless of robot type. On the connection thread this only schedules the request.
+            self.load_photo_info(_return_future=False)
         return self._photo_info
 
     @connection.on_connection_thread()
@@ -24,7 +24,6 @@ caller may use to obtain the result when they desire.
 # __all__ should order by constants, event classes, other classes, functions.
 __all__ = ['Robot', 'AsyncRobot']
 
-import concurrent
 import functools
 
 from . import (animation, audio, behavior, camera,
@@ -90,7 +89,9 @@ class Robot:
                    that identifies the SDK user. Note: Never share your authentication credentials with anyone.
     :param default_logging: Toggle default logging.
     :param behavior_activation_timeout: The time to wait for control of the robot before failing.
-    :param cache_animation_lists: Get the list of animation triggers and animations available at startup.
+    :param cache_animation_lists: Get the list of animation triggers and animations available at startup. Lists saved
+                                  on disk by a previous connection to the same robot are used immediately, and reloaded
+                                  in the background if Vector's firmware has changed.
     :param enable_face_detection: Turn on face detection.
     :param estimate_facial_expression: Turn estimating facial expression on/off. Enabling :code:`estimate_facial_expression`
                                        returns a facial expression, the expression values and the :class:`anki_vector.util.ImageRect`
@@ -127,7 +128,10 @@ class Robot:
         self.logger = util.get_class_logger(__name__, self)
         self._force_async = False
         config = config if config is not None else {}
-        config = {**util.read_configuration(serial, name, self.logger), **config}
+        file_config = util.read_configuration(serial, name, self.logger)
+        # Configurations are stored in sections named after the robot's serial number
+        self._serial = file_config.name
+        config = {**file_config, **config}
 
         if name is not None:
             vector_mdns = VectorMdns.find_vector(name)
@@ -658,14 +662,13 @@ class Robot:
         self._world = world.World(self)
         self._camera = camera.CameraComponent(self)
 
-        if self.cache_animation_lists:
-            # Load animation triggers and animations so they are ready to play when requested
-            anim_request = self._anim.load_animation_list()
-            if isinstance(anim_request, concurrent.futures.Future):
-                anim_request.result()
-            anim_trigger_request = self._anim.load_animation_trigger_list()
-            if isinstance(anim_trigger_request, concurrent.futures.Future):
-                anim_trigger_request.result()
+        if self.cache_animation_lists and not self._anim._load_cached_animation_lists():  # pylint: disable=protected-access
+            # Load animation triggers and animations so they are ready to play when requested.
+            # Both requests are sent before waiting on either of them.
+            anim_request = self._anim.load_animation_list(_return_future=True)
+            anim_trigger_request = self._anim.load_animation_trigger_list(_return_future=True)
+            anim_request.result()
+            anim_trigger_request.result()
 
         # TODO enable audio feed when ready
 
@@ -682,12 +685,8 @@ class Robot:
 
         # Enable face detection, to allow Vector to add faces to its world view
         if self.conn.requires_behavior_control:
-            face_detection = self.vision.enable_face_detection(detect_faces=self.enable_face_detection, estimate_expression=self.estimate_facial_expression)
-            if isinstance(face_detection, concurrent.futures.Future):
-                face_detection.result()
-            object_detection = self.vision.enable_custom_object_detection(detect_custom_objects=self.enable_custom_object_detection)
-            if isinstance(object_detection, concurrent.futures.Future):
-                object_detection.result()
+            self.vision.enable_face_detection(detect_faces=self.enable_face_detection, estimate_expression=self.estimate_facial_expression, _return_future=False)
+            self.vision.enable_custom_object_detection(detect_custom_objects=self.enable_custom_object_detection, _return_future=False)
 
         # Subscribe to a callback that updates the robot's local properties
         self.events.subscribe(self._unpack_robot_state,
@@ -899,7 +898,9 @@ class AsyncRobot(Robot):
                    that identifies the SDK user. Note: Never share your authentication credentials with anyone.
     :param default_logging: Toggle default logging.
     :param behavior_activation_timeout: The time to wait for control of the robot before failing.
-    :param cache_animation_lists: Get the list of animation triggers and animations available at startup.
+    :param cache_animation_lists: Get the list of animation triggers and animations available at startup. Lists saved
+                                  on disk by a previous connection to the same robot are used immediately, and reloaded
+                                  in the background if Vector's firmware has changed.
     :param enable_face_detection: Turn on face detection.
     :param estimate_facial_expression: Turn estimating facial expression on/off.
     :param enable_audio_feed: Turn audio feed on/off.
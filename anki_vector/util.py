@@ -49,6 +49,7 @@ import math
 import os
 from pathlib import Path
 import sys
+import threading
 import time
 from typing import Callable, Union
 
@@ -1053,9 +1054,15 @@ class RectangleOverlay(BaseOverlay):
             d.rectangle([x1 + i, y1 + i, x2 - i, y2 - i], outline=self.line_color)
 
 
+# Request messages handed out by Component._scratch_request, one set per thread
+_scratch_requests = threading.local()
+
+
 class Component:
     """ Base class for all components."""
 
+    __slots__ = ('logger', '_robot')
+
     def __init__(self, robot):
         self.logger = get_class_logger(__name__, self)
         self._robot = robot
@@ -1078,6 +1085,24 @@ class Component:
         """
         return self._robot.conn.grpc_interface
 
+    @staticmethod
+    def _scratch_request(request_type):
+        """Returns this thread's reusable instance of the given request message type.
+
+        Requests sent often are refilled and reused rather than constructed per call, so every
+        field must be set each time. This relies on the aiogrpc stubs serializing the request
+        synchronously when the rpc is called, before the first suspension point, which leaves
+        the next call on the same thread free to refill it. Stubs that serialize later, such as
+        grpc.aio which does so in a separate task, would corrupt concurrent requests.
+
+        :param request_type: The protobuf request message class.
+        """
+        req = getattr(_scratch_requests, request_type.__name__, None)
+        if req is None:
+            req = request_type()
+            setattr(_scratch_requests, request_type.__name__, req)
+        return req
+
 
 def read_configuration(serial: str, name: str, logger: logging.Logger) -> dict:
     """Open the default conf file, and read it into a :class:`configparser.ConfigParser`
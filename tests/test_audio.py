@@ -0,0 +1,102 @@
+# Copyright (c) 2019 Anki, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License in the file LICENSE.txt or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for opening audio files, and resampling those the robot can't play at their own frame rate."""
+
+import logging
+import struct
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from anki_vector.audio import AudioComponent, _resample
+from anki_vector.exceptions import VectorExternalAudioPlaybackException
+
+
+def _to_bytes(samples):
+    return np.asarray(samples).astype('<i2').tobytes()
+
+
+def _from_bytes(audio_data):
+    return np.frombuffer(audio_data, dtype='<i2')
+
+
+def _tone(frequency, frame_rate, seconds=0.5, amplitude=10000):
+    t = np.arange(int(frame_rate * seconds)) / frame_rate
+    return np.rint(amplitude * np.sin(2 * np.pi * frequency * t))
+
+
+def _rms(samples):
+    return np.sqrt(np.mean(np.square(samples.astype(np.float64))))
+
+
+def test_upsample_length_and_values():
+    samples = np.arange(0, 1000, 100)
+    resampled = _from_bytes(_resample(_to_bytes(samples), 4000, 8000))
+
+    assert len(resampled) == 2 * len(samples)
+    # Original samples are kept, with linearly interpolated samples in between
+    assert np.array_equal(resampled[0::2], samples)
+    assert np.array_equal(resampled[1:-1:2], samples[:-1] + 50)
+    assert resampled[-1] == samples[-1]
+
+
+def test_downsample_length_and_values():
+    samples = _tone(1000, 48000)
+    resampled = _from_bytes(_resample(_to_bytes(samples), 48000, 16000))
+
+    assert len(resampled) == len(samples) // 3
+    # A tone well below the new Nyquist frequency passes through the filter almost unchanged
+    expected = samples[::3]
+    middle = slice(50, -50)
+    assert np.max(np.abs(resampled[middle] - expected[middle])) < 0.02 * 10000
+
+
+def test_downsample_filters_frequencies_above_nyquist():
+    # 12 kHz can't be represented at 16 kHz, and would alias to 4 kHz without filtering
+    samples = _tone(12000, 48000)
+    resampled = _from_bytes(_resample(_to_bytes(samples), 48000, 16000))
+
+    assert _rms(resampled[50:-50]) < 0.01 * _rms(samples)
+
+
+def test_downsample_keeps_samples_in_range():
+    samples = np.where(np.arange(4410) % 20 < 10, 32767, -32768)
+    resampled = _from_bytes(_resample(_to_bytes(samples), 44100, 16000))
+
+    assert len(resampled) == 4410 * 16000 // 44100
+    # Filter overshoot at full scale is clipped rather than wrapping around to the opposite sign
+    positions = np.rint(np.arange(len(resampled)) * 44100 / 16000).astype(int)
+    phase = positions % 20
+    away_from_edges = (phase >= 3) & (phase <= 6) | (phase >= 13) & (phase <= 16)
+    away_from_edges[:20] = False
+    assert np.array_equal(np.sign(resampled[away_from_edges]), np.sign(samples[positions[away_from_edges]]))
+
+
+def test_resample_empty():
+    assert _resample(b'', 44100, 16000) == b''
+    assert _resample(b'', 4000, 8000) == b''
+
+
+def test_open_file_rejects_zero_frame_rate(tmp_path):
+    samples = _to_bytes(np.zeros(100))
+    header = struct.pack('<4sI4s4sIHHIIHH4sI', b'RIFF', 36 + len(samples), b'WAVE', b'fmt ', 16, 1, 1, 0, 0, 2, 16,
+                         b'data', len(samples))
+    path = tmp_path / 'corrupt.wav'
+    path.write_bytes(header + samples)
+    component = SimpleNamespace(logger=logging.getLogger(__name__))
+
+    with pytest.raises(VectorExternalAudioPlaybackException):
+        AudioComponent._open_file(component, str(path))